@@ -1,6 +1,45 @@
+import io
 import os
-import xml.etree.ElementTree as ET
-import struct
+import sys
+import re
+import mmap
+import shutil
+import ast
+import operator
+import functools
+import math
+from collections import deque
+try:
+    from lxml import etree as ET  # C parser, noticeably faster on large definition files
+except ImportError:
+    import xml.etree.ElementTree as ET
+import numpy as np
+
+# NumPy dtypes for each supported (storagetype, endian) pair
+DTYPES = {
+    ("uint16", ">"): ">u2",
+    ("uint16", "<"): "<u2",
+    ("uint8", ">"): "u1",
+    ("uint8", "<"): "u1",
+    ("int8", ">"): "i1",
+    ("int8", "<"): "i1",
+    ("float", ">"): ">f4",
+    ("float", "<"): "<f4",
+}
+
+# The 6 gradient colors in 16-bit terminal color codes
+COLORS = [
+    "\033[31m",  # Red
+    "\033[33m",  # Yellow
+    "\033[32m",  # Green
+    "\033[36m",  # Cyan
+    "\033[34m",  # Blue
+    "\033[35m",  # Magenta
+]
+# Color prefixes and the reset code as bytes, so table text is built by plain concatenation
+COLOR_PREFIXES = tuple(color.encode("ascii") for color in COLORS)
+COLOR_PREFIXES_NP = np.array(COLOR_PREFIXES, dtype=object)
+COLOR_RESET = b"\033[0m"
 
 def list_files(extension):
     """List files in the current directory with a specific extension."""
@@ -27,272 +66,487 @@ def select_file(extension):
         except ValueError:
             print("Please enter a valid number.")
 
+def parse_scaling(scaling_element):
+    """Build a scaling dict from a <scaling> element, compiling its formula to a callable."""
+    if scaling_element is None:
+        return None
+    scaling = {
+        "name": scaling_element.get("name"),
+        "toexpr": scaling_element.get("toexpr"),
+        "storagetype": scaling_element.get("storagetype"),
+        "endian": scaling_element.get("endian", "big"),
+        "_fn": None,
+        "_affine": None,
+        "_identity": False,
+    }
+
+    # Identity scalings skip the scaling pass entirely
+    if scaling["toexpr"] is None or scaling["toexpr"].strip() == "x":
+        scaling["_identity"] = True
+        return scaling
+
+    try:
+        scaling["_affine"] = _affine(scaling["toexpr"])
+        scaling["_fn"] = _build_scaler(scaling["toexpr"])
+    except (SyntaxError, TypeError, ValueError, ArithmeticError) as e:
+        print(f"Unsupported scaling '{scaling_element.get('name')}': {e}")
+    return scaling
+
+def storage_dtype(scaling):
+    """Return the NumPy dtype for a table's storagetype and endian, defaulting to uint16."""
+    storagetype = scaling.get("storagetype") if scaling else "uint16"
+    endian = ">" if scaling and scaling.get("endian") == "big" else "<"
+    return DTYPES.get((storagetype, endian), DTYPES[("uint16", endian)])
+
+def lookup_scaling(name, scaling_elements, scalings):
+    """Return the parsed scaling with the given name, parsing it the first time it is referenced."""
+    if not name:
+        return None  # Tables without a scaling attribute are unscaled
+    if name not in scalings:
+        scalings[name] = parse_scaling(scaling_elements.get(name))
+    return scalings[name]
+
+def build_mapping(table, scaling_elements, scalings):
+    """Build the mapping with detailed table information for a single <table> element."""
+    address = table.get("address")
+    elements_x_table = table.find(".//table[@type='X Axis']")
+    elements_y_table = table.find(".//table[@type='Y Axis']")
+
+    # Extract table scaling
+    table_scaling = lookup_scaling(table.get("scaling"), scaling_elements, scalings)
+
+    # Extract X-axis scaling
+    x_scaling = None
+    if elements_x_table is not None:
+        x_scaling = lookup_scaling(elements_x_table.get("scaling"), scaling_elements, scalings)
+
+    # Extract Y-axis scaling
+    y_scaling = None
+    if elements_y_table is not None:
+        y_scaling = lookup_scaling(elements_y_table.get("scaling"), scaling_elements, scalings)
+
+    # Extract the `swapxy` attribute
+    swapxy = table.get("swapxy", "false").lower() == "true"
+
+    return {
+        "name": table.get("name", ""),
+        "address": int(address, 16) if address else 0,
+        "type": table.get("type"),
+        "elements_x": int(elements_x_table.get("elements", "0")) if elements_x_table is not None else 0,
+        "elements_y": int(elements_y_table.get("elements", "0")) if elements_y_table is not None else 0,
+        "address_x": int(elements_x_table.get("address"), 16) if elements_x_table is not None else None,
+        "address_y": int(elements_y_table.get("address"), 16) if elements_y_table is not None else None,
+        "scaling_x": x_scaling,
+        "scaling_y": y_scaling,
+        "scaling": table_scaling,
+        "dtype": storage_dtype(table_scaling),
+        "swapxy": swapxy,  # Include the `swapxy` attribute in the mapping
+    }
+
+def _scalings_known(table, scaling_elements):
+    """Check whether every scaling referenced by a table and its axes has been parsed."""
+    return all(t.get("scaling") in scaling_elements for t in table.iter("table") if t.get("scaling"))
+
+def _emit_table(table, parent, scaling_elements, scalings):
+    """Yield the mappings for a top-level table and its axes, then free the consumed elements."""
+    for t in table.iter("table"):
+        yield build_mapping(t, scaling_elements, scalings)
+    table.clear()
+    if parent is not None:
+        parent.remove(table)
+
 def parse_xml(xml_file):
-    """Parse the XML file to extract mappings and detailed table information."""
-    tree = ET.parse(xml_file)
-    root = tree.getroot()
-
-    mappings = []
-    for table in root.findall(".//table"):
-        address = table.get("address")
-        elements_x_table = table.find(".//table[@type='X Axis']")
-        elements_y_table = table.find(".//table[@type='Y Axis']")
-
-        # Extract table scaling
-        table_scaling_name = table.get("scaling")
-        table_scaling = None
-        if table_scaling_name:
-            table_scaling_element = root.find(f".//scaling[@name='{table_scaling_name}']")
-            if table_scaling_element is not None:
-                table_scaling = {
-                    "toexpr": table_scaling_element.get("toexpr"),
-                    "storagetype": table_scaling_element.get("storagetype"),
-                    "endian": table_scaling_element.get("endian", "big"),
-                }
-
-        # Extract X-axis scaling
-        x_scaling = None
-        if elements_x_table is not None and elements_x_table.get("scaling"):
-            x_scaling_name = elements_x_table.get("scaling")
-            x_scaling_element = root.find(f".//scaling[@name='{x_scaling_name}']")
-            if x_scaling_element is not None:
-                x_scaling = {
-                    "toexpr": x_scaling_element.get("toexpr"),
-                    "storagetype": x_scaling_element.get("storagetype"),
-                    "endian": x_scaling_element.get("endian", "big"),
-                }
-
-        # Extract Y-axis scaling
-        y_scaling = None
-        if elements_y_table is not None and elements_y_table.get("scaling"):
-            y_scaling_name = elements_y_table.get("scaling")
-            y_scaling_element = root.find(f".//scaling[@name='{y_scaling_name}']")
-            if y_scaling_element is not None:
-                y_scaling = {
-                    "toexpr": y_scaling_element.get("toexpr"),
-                    "storagetype": y_scaling_element.get("storagetype"),
-                    "endian": y_scaling_element.get("endian", "big"),
-                }
-
-        # Extract the `swapxy` attribute
-        swapxy = table.get("swapxy", "false").lower() == "true"
-
-        mapping = {
-            "name": table.get("name", ""),
-            "address": int(address, 16) if address else 0,
-            "type": table.get("type"),
-            "elements_x": int(elements_x_table.get("elements", "0")) if elements_x_table is not None else 0,
-            "elements_y": int(elements_y_table.get("elements", "0")) if elements_y_table is not None else 0,
-            "address_x": int(elements_x_table.get("address"), 16) if elements_x_table is not None else None,
-            "address_y": int(elements_y_table.get("address"), 16) if elements_y_table is not None else None,
-            "scaling_x": x_scaling,
-            "scaling_y": y_scaling,
-            "scaling": table_scaling,
-            "swapxy": swapxy,  # Include the `swapxy` attribute in the mapping
-        }
-        mappings.append(mapping)
-    return mappings
-
-def apply_scaling(value, scaling):
-    """Apply a scaling formula (if any) to a value and round to 2 decimal places."""
-    if scaling and "toexpr" in scaling:
-        x = value  # Variable used in the formula
-        try:
-            result = eval(scaling["toexpr"])
-            return round(result, 2)
-        except ZeroDivisionError:
-            print(f"Scaling error: Division by zero in scaling formula with value {value}")
-            return 0  # Default to 0 or another fallback
-        except Exception as e:
-            print(f"Error applying scaling: {e}")
-            return value  # Return raw value on error
-    return value  # No scaling
+    """Stream the XML file, yielding a mapping with detailed table information for each table."""
+    scaling_elements = {}  # Scaling elements by name, collected as they are parsed
+    scalings = {}  # Parsed scalings, shared by every table referencing the same name
+    pending = deque()  # Top-level tables (with their parent) waiting to be emitted in document order
+    parents = []  # Currently open elements
+    table_depth = 0
+
+    for event, element in ET.iterparse(xml_file, events=("start", "end")):
+        if event == "start":
+            table_depth += element.tag == "table"
+            parents.append(element)
+            continue
+        parents.pop()
+
+        if element.tag == "scaling":
+            if element.get("name"):
+                scaling_elements.setdefault(element.get("name"), element)
+        elif element.tag == "table":
+            table_depth -= 1
+            if table_depth:
+                continue  # Axis tables are emitted together with their parent table
+            pending.append((element, parents[-1] if parents else None))
+        else:
+            continue
 
-def apply_text_color(value, min_val, max_val):
-    """Apply a color gradient with 6 distinct colors to a text value."""
-    if max_val - min_val == 0:
-        normalized = 0  # Prevent division by zero
-    else:
-        normalized = (value - min_val) / (max_val - min_val)
+        # Emit tables as soon as all of their scalings are known
+        while pending and _scalings_known(pending[0][0], scaling_elements):
+            yield from _emit_table(*pending.popleft(), scaling_elements, scalings)
 
-    # Define the 6 colors in 16-bit terminal color codes
-    colors = [
-        "\033[31m",  # Red
-        "\033[33m",  # Yellow
-        "\033[32m",  # Green
-        "\033[36m",  # Cyan
-        "\033[34m",  # Blue
-        "\033[35m",  # Magenta
-    ]
+    # Scalings that never appeared are left unresolved, like a failed lookup
+    while pending:
+        yield from _emit_table(*pending.popleft(), scaling_elements, scalings)
 
-    # Map normalized value to one of the 6 colors
-    color_index = int(normalized * (len(colors) - 1))
-    color = colors[color_index]
+# Matches affine scaling formulas of the form `x*a`, `x*a+b` or `x*a-b`
+NUMBER = r"(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+AFFINE_EXPR = re.compile(rf"\s*x\s*\*\s*([-+]?{NUMBER})\s*(?:([+-])\s*({NUMBER}))?\s*")
 
-    # Return the value as colored text
-    return f"{color}{value:.2f}\033[0m"
+def _literal(token):
+    """Convert a numeric literal, keeping integers as ints like eval would."""
+    return float(token) if re.search(r"[.eE]", token) else int(token)
+
+@functools.lru_cache(maxsize=None)
+def _affine(src):
+    """Return the (a, b) constants of an affine formula `x*a+b`, or None if it is not affine."""
+    match = AFFINE_EXPR.fullmatch(src)
+    if not match:
+        return None
+    factor, sign, offset = match.groups()
+    a = _literal(factor)
+    b = _literal(offset) if offset else 0
+    if not (math.isfinite(a) and math.isfinite(b)):
+        return None  # e.g. `x*1e999`; left to the generic path, which reports the non-finite results
+    return a, -b if sign == "-" else b
+
+# Arithmetic allowed in scaling formulas
+BINARY_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+UNARY_OPS = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+
+# Limits for folding constant powers, so a formula like `9**9**9` cannot hang the parser
+MAX_POW_EXPONENT = 100
+MAX_POW_BITS = 4096
+
+def _check_pow(base, exponent):
+    """Reject constant powers whose exponent or integer result would be unreasonably large."""
+    if abs(exponent) > MAX_POW_EXPONENT:
+        raise ValueError(f"exponent {exponent} too large in scaling formula")
+    if isinstance(base, int) and isinstance(exponent, int) and base.bit_length() * abs(exponent) > MAX_POW_BITS:
+        raise ValueError("constant power too large in scaling formula")
+
+def _lower(node):
+    """Lower an expression node to a callable of `x`, or to a plain number for constants."""
+    if isinstance(node, ast.Name) and node.id == "x":
+        return lambda x: x
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and type(node.op) in UNARY_OPS:
+        op = UNARY_OPS[type(node.op)]
+        operand = _lower(node.operand)
+        if not callable(operand):
+            return op(operand)
+        return lambda x: op(operand(x))
+    if isinstance(node, ast.BinOp) and type(node.op) in BINARY_OPS:
+        op = BINARY_OPS[type(node.op)]
+        left, right = _lower(node.left), _lower(node.right)
+        if not callable(left) and not callable(right):
+            if op is operator.pow:
+                _check_pow(left, right)
+            value = op(left, right)
+            if type(value) not in (int, float):
+                raise ValueError(f"constant {value} in scaling formula is not a real number")
+            return value
+        if not callable(right):
+            return lambda x: op(left(x), right)
+        if not callable(left):
+            return lambda x: op(left, right(x))
+        return lambda x: op(left(x), right(x))
+    raise ValueError(f"unsupported syntax '{type(node).__name__}' in scaling formula")
+
+def _build_scaler(src):
+    """Compile a scaling formula into a callable of `x`, allowing only arithmetic on `x` and numbers."""
+    affine = _affine(src)
+    if affine:
+        a, b = affine
+        return lambda x: x * a + b
+    scaler = _lower(ast.parse(src, mode="eval").body)
+    if not callable(scaler):
+        return lambda x: scaler
+    return scaler
+
+def _scaling_dtype(dtype, affine):
+    """Pick the dtype a scaling is evaluated in: int64 for affine formulas on integer storage whose
+    results provably fit in int64, float64 for everything else so nothing can wrap around."""
+    dtype = np.dtype(dtype)
+    if affine and dtype.kind in "iu":
+        a, b = affine
+        info = np.iinfo(dtype)
+        bound = abs(a) * max(info.max, -info.min) + abs(b)
+        if bound <= np.iinfo(np.int64).max:
+            return np.int64
+    return np.float64
+
+def scale_identity(values):
+    """Apply an identity scaling: integers are already exact, floats only need rounding."""
+    if values.dtype.kind in "iu":
+        return values
+    with np.errstate(invalid="ignore"):
+        return values.astype(np.float64).round(2)
+
+def apply_scaling(values, scaling):
+    """Apply a scaling formula (if any) to an array of values and round to 2 decimal places."""
+    if scaling and scaling.get("_identity"):
+        return scale_identity(values)
+    if scaling and scaling.get("_fn"):
+        x = values.astype(_scaling_dtype(values.dtype, scaling.get("_affine")))
+        try:
+            with np.errstate(divide="ignore", over="ignore", invalid="ignore"):
+                result = scaling["_fn"](x)
+            result = np.broadcast_to(result, x.shape).copy()
+        except Exception as e:
+            print(f"Error applying scaling: {e}")
+            return values  # Return raw values on error
+
+        # Division by zero, overflow or an undefined operation produces inf/nan; fall back to 0 for those values
+        invalid = ~np.isfinite(result) & np.isfinite(x)
+        for value in values[invalid]:
+            print(f"Scaling error: Invalid result (inf or nan) in scaling formula with value {value}")
+        result[invalid] = 0
+        return result.round(2)
+    return values  # No scaling
+
+def apply_text_color(data, min_val, value_range):
+    """Apply a color gradient with 6 distinct colors to a 2D array, returning the whole table as text."""
+    # NaN cells have no meaningful color; silence the invalid-cast warning they raise
+    with np.errstate(invalid="ignore"):
+        if value_range == 0:
+            normalized = np.zeros(data.shape)  # Prevent division by zero
+        else:
+            normalized = (data - min_val) / value_range
+
+        # Map every normalized value to one of the 6 colors in a single pass
+        color_index = np.clip((normalized * (len(COLORS) - 1)).astype(np.int32), 0, len(COLORS) - 1)
+    prefixes = COLOR_PREFIXES_NP[color_index]
+
+    # Build each row from the byte codes and decode it once
+    return "".join(
+        b"  ".join(prefix + b"%.2f" % value + COLOR_RESET for prefix, value in zip(row_prefixes, row)).decode("ascii") + "\n"
+        for row_prefixes, row in zip(prefixes.tolist(), data.tolist())
+    )
+
+def read_table(binary_data, dtype, address, elements_x, elements_y):
+    """Read a whole table as a (elements_y, elements_x) array with a single buffer read."""
+    if not (elements_x and elements_y):
+        return np.empty((elements_y, elements_x), dtype=dtype)
+    table = np.frombuffer(binary_data, dtype=dtype, count=elements_x * elements_y, offset=address)
+    return table.reshape(elements_y, elements_x)
+
+@functools.lru_cache(maxsize=None)
+def table_decoder(dtype, identity, affine):
+    """Generate a straight-line decoder for tables stored as `dtype` with an identity or affine scaling, or None."""
+    namespace = {"np": np, "scale_identity": scale_identity}
+    if identity:
+        result = "scale_identity(raw)"
+    elif affine:
+        # The constants are bound by name rather than pasted into the source as literals
+        namespace["a"], namespace["b"] = affine
+        namespace["promote"] = _scaling_dtype(dtype, affine)
+        result = "(raw.astype(promote) * a + b).round(2)"
+    else:
+        return None  # Other formulas go through apply_scaling
+
+    source = (
+        "def decode(buf, offset, count):\n"
+        f"    raw = np.frombuffer(buf, dtype={dtype!r}, count=count, offset=offset)\n"
+        f"    return {result}\n"
+    )
+    exec(compile(source, f"<decoder {dtype} {identity} {affine}>", "exec"), namespace)
+    return namespace["decode"]
+
+def group_mappings(mappings):
+    """Group mappings sharing a storage dtype and table scaling, remembering each one's original position."""
+    groups = {}
+    for index, mapping in enumerate(mappings):
+        scaling = mapping.get("scaling")
+        key = (mapping["dtype"], scaling["name"] if scaling else None)
+        groups.setdefault(key, []).append((index, mapping))
+    return groups
 
 def decode_bin(binary_file, mappings):
     """Decode the binary file using the extracted mappings."""
     with open(binary_file, "rb") as bin_file:
-        binary_data = bin_file.read()
-
+        # Map the file instead of reading it; arrays read from the map are zero-copy views.
+        # mmap rejects empty files, so those decode from an empty buffer (every table then errors).
+        binary_data = b""
+        if os.fstat(bin_file.fileno()).st_size:
+            binary_data = mmap.mmap(bin_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    decoded = []
+    for (dtype, _), group in group_mappings(mappings).items():
+        # The dtype, table scaling and generated decoder are shared by the whole group
+        table_scaling = group[0][1].get("scaling")
+        decoder = None
+        if table_scaling:
+            decoder = table_decoder(dtype, table_scaling["_identity"], table_scaling["_affine"])
+        for index, mapping in group:
+            try:
+                # Base attributes
+                address = mapping["address"]
+                elements_x = mapping.get("elements_x", 0)
+                elements_y = mapping.get("elements_y", 0)
+                address_x = mapping.get("address_x")
+                address_y = mapping.get("address_y")
+                scaling_x = mapping.get("scaling_x", table_scaling)
+                scaling_y = mapping.get("scaling_y", table_scaling)
+                swap_axes = mapping.get("swapxy", False)  # Check if axes need to be swapped
+
+                # Decode X and Y Axes, handling `swapxy="true"`
+                if swap_axes:
+                    # Swap lengths and addresses
+                    elements_x, elements_y = elements_y, elements_x
+                    address_x, address_y = address_y, address_x
+                    scaling_x, scaling_y = scaling_y, scaling_x
+
+                # Decode X Axis
+                x_axis = []
+                if address_x and elements_x:
+                    x_raw = np.frombuffer(binary_data, dtype=dtype, count=elements_x, offset=address_x)
+                    x_axis = apply_scaling(x_raw, scaling_x).tolist()
+
+                # Decode Y Axis
+                y_axis = []
+                if address_y and elements_y:
+                    y_raw = np.frombuffer(binary_data, dtype=dtype, count=elements_y, offset=address_y)
+                    y_axis = apply_scaling(y_raw, scaling_y).tolist()
+
+                # Decode Table Data with a single read of all rows
+                if decoder and elements_x * elements_y:
+                    table_data = decoder(binary_data, address, elements_x * elements_y).reshape(elements_y, elements_x)
+                else:
+                    table_raw = read_table(binary_data, dtype, address, elements_x, elements_y)
+                    table_data = apply_scaling(table_raw, table_scaling)
+
+                # Handle `swapxy="true"`
+                if swap_axes:
+                    # Transpose the table data after swapping
+                    table_data = table_data.T
+
+                decoded.append((index, mapping["name"], {
+                    "x_axis": x_axis,
+                    "y_axis": y_axis,
+                    "data": table_data,
+                }))
+
+            except Exception as e:
+                print(f"Error decoding table '{mapping['name']}': {e}")
+                continue
+
+    # Store decoded data in the original table order
     decoded_data = {}
-    for mapping in mappings:
-        try:
-            # Base attributes
+    for _, name, table in sorted(decoded, key=lambda item: item[0]):
+        decoded_data[name] = table
+    return decoded_data
+
+def to_storage(values, dtype):
+    """Convert user-entered values to the storage dtype, rounding and range-checking integer types."""
+    values = np.asarray(values, dtype=np.float64)
+    dtype = np.dtype(dtype)
+    if dtype.kind in "iu":
+        if not np.isfinite(values).all():
+            raise ValueError(f"Invalid value for {dtype.name}: expected a finite number.")
+        values = np.rint(values)
+        info = np.iinfo(dtype)
+        if values.size and (values.min() < info.min or values.max() > info.max):
+            raise ValueError(f"Value out of range for {dtype.name}: expected {info.min} to {info.max}.")
+    return values.astype(dtype)
+
+def edit_bin(binary_file, mappings):
+    """Edit the binary file by replacing an entire table including axes based on user input via the terminal."""
+    if os.path.getsize(binary_file) == 0:
+        print(f"Binary file '{binary_file}' is empty; nothing to edit.")
+        return
+
+    # Edit a copy of the binary in place through a writable memory map
+    modified_file = "modified_" + binary_file
+    shutil.copyfile(binary_file, modified_file)
+    with open(modified_file, "r+b") as bin_file:
+        binary_data = mmap.mmap(bin_file.fileno(), 0, access=mmap.ACCESS_WRITE)
+
+    try:
+        for mapping in mappings:
+            name = mapping["name"]
+            print(f"Editing table: {name}")
             address = mapping["address"]
             elements_x = mapping.get("elements_x", 0)
             elements_y = mapping.get("elements_y", 0)
             address_x = mapping.get("address_x")
             address_y = mapping.get("address_y")
-            table_scaling = mapping.get("scaling")
-            scaling_x = mapping.get("scaling_x", table_scaling)
-            scaling_y = mapping.get("scaling_y", table_scaling)
-            swap_axes = mapping.get("swapxy", False)  # Check if axes need to be swapped
-            storagetype = table_scaling.get("storagetype") if table_scaling else "uint16"
-            endian = ">" if table_scaling and table_scaling.get("endian") == "big" else "<"
-
-            # Determine struct format based on storagetype
-            format_char = "H"  # Default to uint16
-            if storagetype == "uint8":
-                format_char = "B"
-            elif storagetype == "int8":
-                format_char = "b"
-            elif storagetype == "float":
-                format_char = "f"
-
-            # Decode X and Y Axes, handling `swapxy="true"`
-            if swap_axes:
-                # Swap lengths and addresses
-                elements_x, elements_y = elements_y, elements_x
-                address_x, address_y = address_y, address_x
-                scaling_x, scaling_y = scaling_y, scaling_x
-
-            # Decode X Axis
-            x_axis = []
-            if address_x and elements_x:
-                x_raw = struct.unpack_from(f"{endian}{elements_x}{format_char}", binary_data, address_x)
-                x_axis = [apply_scaling(val, scaling_x) for val in x_raw]
+            dtype = mapping["dtype"]
 
-            # Decode Y Axis
-            y_axis = []
+            # Show existing x, y, and table data
+            if address_x and elements_x:
+                x_axis = np.frombuffer(binary_data, dtype=dtype, count=elements_x, offset=address_x).tolist()
+                print(f"X Axis: {x_axis}")
             if address_y and elements_y:
-                y_raw = struct.unpack_from(f"{endian}{elements_y}{format_char}", binary_data, address_y)
-                y_axis = [apply_scaling(val, scaling_y) for val in y_raw]
-
-            # Decode Table Data
-            table_data = []
-            row_size = elements_x * struct.calcsize(format_char)
-            for row_idx in range(elements_y):
-                start = address + row_idx * row_size
-                row_raw = struct.unpack_from(f"{endian}{elements_x}{format_char}", binary_data, start)
-                row_scaled = [apply_scaling(val, table_scaling) for val in row_raw]
-                table_data.append(row_scaled)
-
-            # Handle `swapxy="true"`
-            if swap_axes:
-                # Transpose the table data after swapping
-                table_data = list(map(list, zip(*table_data)))
-
-            # Store decoded data
-            decoded_data[mapping["name"]] = {
-                "x_axis": x_axis,
-                "y_axis": y_axis,
-                "data": table_data,
-            }
-
-        except Exception as e:
-            print(f"Error decoding table '{mapping['name']}': {e}")
-            continue
-
-    return decoded_data
-
-def edit_bin(binary_file, mappings):
-    """Edit the binary file by replacing an entire table including axes based on user input via the terminal."""
-    with open(binary_file, "rb") as bin_file:
-        binary_data = bytearray(bin_file.read())
-
-    for mapping in mappings:
-        name = mapping["name"]
-        print(f"Editing table: {name}")
-        address = mapping["address"]
-        elements_x = mapping.get("elements_x", 0)
-        elements_y = mapping.get("elements_y", 0)
-        address_x = mapping.get("address_x")
-        address_y = mapping.get("address_y")
-        scaling = mapping.get("scaling")
-        storagetype = scaling.get("storagetype") if scaling else "uint16"
-        endian = ">" if scaling and scaling.get("endian") == "big" else "<"
-
-        # Determine struct format based on storagetype
-        format_char = "H"  # Default to uint16
-        if storagetype == "uint8":
-            format_char = "B"
-        elif storagetype == "int8":
-            format_char = "b"
-        elif storagetype == "float":
-            format_char = "f"
-
-        # Show existing x, y, and table data
-        if address_x and elements_x:
-            x_axis = list(struct.unpack_from(f"{endian}{elements_x}{format_char}", binary_data, address_x))
-            print(f"X Axis: {x_axis}")
-        if address_y and elements_y:
-            y_axis = list(struct.unpack_from(f"{endian}{elements_y}{format_char}", binary_data, address_y))
-            print(f"Y Axis: {y_axis}")
-        table_data = []
-        for row in range(elements_y):
-            start = address + row * elements_x * struct.calcsize(format_char)
-            row_data = list(struct.unpack_from(f"{endian}{elements_x}{format_char}", binary_data, start))
-            table_data.append(row_data)
-            print(f"Row {row + 1}: {row_data}")
-
-        # Prompt for full table replacement, including axes
-        print(f"Enter new data for the table '{name}' including X and Y axes (row by row, space-separated):")
-        new_x_axis = input("Enter new X Axis (space-separated): ")
-        new_y_axis = input("Enter new Y Axis (space-separated): ")
-        new_table_input = input("Paste the full table data here (rows space-separated):\n")
-
-        try:
-            # Parse X Axis
-            new_x_axis = [float(x) for x in new_x_axis.split()]
-            if len(new_x_axis) != elements_x:
-                raise ValueError(f"X Axis length mismatch: expected {elements_x}, got {len(new_x_axis)}.")
-
-            # Parse Y Axis
-            new_y_axis = [float(y) for y in new_y_axis.split()]
-            if len(new_y_axis) != elements_y:
-                raise ValueError(f"Y Axis length mismatch: expected {elements_y}, got {len(new_y_axis)}.")
-
-            # Parse Table Data
-            new_table_data = []
-            for line in new_table_input.strip().splitlines():
-                row = [float(x) for x in line.split()]
-                if len(row) != elements_x:
-                    raise ValueError(f"Row length mismatch: expected {elements_x}, got {len(row)}.")
-                new_table_data.append(row)
-            if len(new_table_data) != elements_y:
-                raise ValueError(f"Number of rows mismatch: expected {elements_y}, got {len(new_table_data)}.")
-
-            # Write X Axis
-            struct.pack_into(f"{endian}{len(new_x_axis)}{format_char}", binary_data, address_x, *new_x_axis)
-
-            # Write Y Axis
-            struct.pack_into(f"{endian}{len(new_y_axis)}{format_char}", binary_data, address_y, *new_y_axis)
-
-            # Write Table Data
-            for row_idx, row_data in enumerate(new_table_data):
-                start = address + row_idx * elements_x * struct.calcsize(format_char)
-                struct.pack_into(f"{endian}{len(row_data)}{format_char}", binary_data, start, *row_data)
-
-        except ValueError as e:
-            print(f"Error: {e}")
-            continue
+                y_axis = np.frombuffer(binary_data, dtype=dtype, count=elements_y, offset=address_y).tolist()
+                print(f"Y Axis: {y_axis}")
+            table_data = read_table(binary_data, dtype, address, elements_x, elements_y).tolist()
+            for row, row_data in enumerate(table_data):
+                print(f"Row {row + 1}: {row_data}")
+
+            # Prompt for full table replacement, including axes
+            print(f"Enter new data for the table '{name}' including X and Y axes (row by row, space-separated):")
+            new_x_axis = input("Enter new X Axis (space-separated): ")
+            new_y_axis = input("Enter new Y Axis (space-separated): ")
+            new_table_input = input("Paste the full table data here (rows space-separated):\n")
+
+            try:
+                # Parse X Axis
+                new_x_axis = np.array(new_x_axis.split(), dtype=np.float64)
+                if new_x_axis.size != elements_x:
+                    raise ValueError(f"X Axis length mismatch: expected {elements_x}, got {new_x_axis.size}.")
+
+                # Parse Y Axis
+                new_y_axis = np.array(new_y_axis.split(), dtype=np.float64)
+                if new_y_axis.size != elements_y:
+                    raise ValueError(f"Y Axis length mismatch: expected {elements_y}, got {new_y_axis.size}.")
+
+                # Parse Table Data in one pass (ragged rows are rejected by loadtxt)
+                new_table_data = np.empty((0, elements_x))
+                if new_table_input.strip():
+                    new_table_data = np.loadtxt(io.StringIO(new_table_input), dtype=np.float64, ndmin=2)
+                rows, columns = new_table_data.shape
+                if columns != elements_x:
+                    raise ValueError(f"Row length mismatch: expected {elements_x}, got {columns}.")
+                if rows != elements_y:
+                    raise ValueError(f"Number of rows mismatch: expected {elements_y}, got {rows}.")
+
+                # Convert everything first so an out-of-range value leaves the table untouched
+                writes = [
+                    (address_x, to_storage(new_x_axis, dtype)),
+                    (address_y, to_storage(new_y_axis, dtype)),
+                    (address, to_storage(new_table_data, dtype)),
+                ]
+
+                # Write X Axis, Y Axis and Table Data straight into the mapped file
+                for offset, values in writes:
+                    if offset is not None and values.size:
+                        np.frombuffer(binary_data, dtype=dtype, count=values.size, offset=offset)[:] = values.ravel()
+
+            except ValueError as e:
+                print(f"Error: {e}")
+                continue
+    except BaseException:
+        # Don't leave a half-edited copy behind if editing is aborted
+        binary_data.close()
+        os.remove(modified_file)
+        raise
 
     # Save the modified binary file
-    with open("modified_" + binary_file, "wb") as modified_bin_file:
-        modified_bin_file.write(binary_data)
+    binary_data.flush()
+    binary_data.close()
 
 def main():
     # Select XML and binary files
@@ -307,34 +561,34 @@ def main():
         return
 
     # Parse XML file
-    mappings = parse_xml(xml_file)
+    mappings = list(parse_xml(xml_file))
 
     # Decode binary file
     decoded_data = decode_bin(binary_file, mappings)
 
-    # Output decoded data
-    print("\nDecoded data:")
+    # Output decoded data, collected in a buffer and written in one go
+    report = io.StringIO()
+    report.write("\nDecoded data:\n")
     for key, value in decoded_data.items():
-        print(f"\n{'=' * 50}")
-        print(f"Table: {key}")
-        print(f"{'-' * 50}")
-        print(f"X Axis: {', '.join(map(str, value['x_axis']))}")
-        print(f"Y Axis: {', '.join(map(str, value['y_axis']))}")
+        report.write(f"\n{'=' * 50}\n")
+        report.write(f"Table: {key}\n")
+        report.write(f"{'-' * 50}\n")
+        report.write(f"X Axis: {', '.join(map(str, value['x_axis']))}\n")
+        report.write(f"Y Axis: {', '.join(map(str, value['y_axis']))}\n")
 
         # Handle empty data gracefully
-        if not value["data"] or all(not row for row in value["data"]):
-            print("Data: (empty table)")
+        if value["data"].size == 0:
+            report.write("Data: (empty table)\n")
             continue
 
         # Calculate min and max values for the color gradient
-        flat_data = [val for row in value["data"] for val in row]
-        min_val = min(flat_data)
-        max_val = max(flat_data)
-
-        print("Data:")
-        for row in value["data"]:
-            colored_row = "  ".join(apply_text_color(val, min_val, max_val) for val in row)
-            print(colored_row)
+        data = value["data"]
+        min_val = float(data.min())
+        value_range = float(data.max()) - min_val
+
+        report.write("Data:\n")
+        report.write(apply_text_color(data, min_val, value_range))
+    sys.stdout.write(report.getvalue())
 
     # Uncomment this block to enable editing functionality
     # edit_mode = input("\nDo you want to edit the binary file? (y/n): ").strip().lower() == "y"